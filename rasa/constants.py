@@ -37,3 +37,4 @@ ENV_SANIC_BACKLOG = "SANIC_BACKLOG"
 ENV_GPU_CONFIG = "TF_GPU_MEMORY_ALLOC"
 ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
+ENV_MIXED_PRECISION_POLICY = "TF_MIXED_PRECISION_POLICY"
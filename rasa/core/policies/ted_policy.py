@@ -63,6 +63,7 @@ from rasa.utils.tensorflow.model_data import (
 )
 from rasa.utils.tensorflow.model_data_utils import convert_to_data_format
 from rasa.utils.tensorflow.constants import (
+    COSINE,
     LABEL,
     IDS,
     TRANSFORMER_SIZE,
@@ -378,6 +379,18 @@ class TEDPolicy(Policy):
         self._label_data: Optional[RasaModelData] = None
         self.data_example: Optional[Dict[Text, Dict[Text, List[FeatureArray]]]] = None
 
+        # in-process cache for the encoded label data, keyed by the
+        # fingerprints of its inputs; encoding all labels is independent of the
+        # training trackers and only has to be redone when the domain or the
+        # precomputed features change
+        self._label_data_cache: Optional[
+            Tuple[
+                Tuple[Text, Optional[Text]],
+                RasaModelData,
+                List[Dict[Text, List[Features]]],
+            ]
+        ] = None
+
         self.tmp_checkpoint_dir = None
         if self.config[CHECKPOINT_MODEL]:
             self.tmp_checkpoint_dir = Path(rasa.utils.io.create_temporary_directory())
@@ -412,6 +425,17 @@ class TEDPolicy(Policy):
         domain: Domain,
         precomputations: Optional[MessageContainerForCoreFeaturization],
     ) -> Tuple[RasaModelData, List[Dict[Text, List[Features]]]]:
+        cache_key = (
+            domain.fingerprint(),
+            precomputations.fingerprint() if precomputations is not None else None,
+        )
+        if (
+            self._label_data_cache is not None
+            and self._label_data_cache[0] == cache_key
+        ):
+            _, label_data, encoded_all_labels = self._label_data_cache
+            return label_data, encoded_all_labels
+
         # encode all label_ids with policies' featurizer
         state_featurizer = self.featurizer.state_featurizer
         encoded_all_labels = (
@@ -426,6 +450,8 @@ class TEDPolicy(Policy):
 
         label_data = self._assemble_label_data(attribute_data, domain)
 
+        self._label_data_cache = (cache_key, label_data, encoded_all_labels)
+
         return label_data, encoded_all_labels
 
     def _assemble_label_data(
@@ -521,9 +547,20 @@ class TEDPolicy(Policy):
         model_data = RasaModelData(label_key=LABEL_KEY, label_sub_key=LABEL_SUB_KEY)
 
         if label_ids is not None and encoded_all_labels is not None:
-            label_ids = np.array(
-                [np.expand_dims(seq_label_ids, -1) for seq_label_ids in label_ids]
-            )
+            if label_ids.ndim == 2:
+                # all examples have the same number of labels per turn, so the
+                # extra axis can be added in one vectorized operation
+                label_ids = np.expand_dims(label_ids, -1)
+            else:
+                # examples differ in their number of dialogue turns, so the
+                # extra axis has to be added per example; pre-allocate the
+                # ragged result as an object array and fill it with views onto
+                # the original label ids instead of building an intermediate
+                # list and letting numpy infer the (inhomogeneous) shape
+                reshaped_label_ids = np.empty(len(label_ids), dtype=object)
+                for index, seq_label_ids in enumerate(label_ids):
+                    reshaped_label_ids[index] = np.expand_dims(seq_label_ids, -1)
+                label_ids = reshaped_label_ids
             model_data.add_features(
                 LABEL_KEY,
                 LABEL_SUB_KEY,
@@ -551,11 +588,12 @@ class TEDPolicy(Policy):
 
         # add the dialogue lengths
         attribute_present = next(iter(list(attribute_data.keys())))
-        dialogue_lengths = np.array(
-            [
-                np.size(np.squeeze(f, -1))
-                for f in model_data.data[attribute_present][MASK][0]
-            ]
+        # each mask has shape (dialogue length, 1), so its first dimension is
+        # the dialogue length; store as int32 right away since the lengths are
+        # only ever used as indices and ranges
+        dialogue_lengths = np.fromiter(
+            (len(f) for f in model_data.data[attribute_present][MASK][0]),
+            dtype=np.int32,
         )
         model_data.data[DIALOGUE][LENGTH] = [
             FeatureArray(dialogue_lengths, number_of_dimensions=1)
@@ -1145,6 +1183,20 @@ class TEDPolicy(Policy):
         )
         return model
 
+    @staticmethod
+    def _filter_prediction_features(data: Data) -> Data:
+        """Keeps only those features which are usable at prediction time.
+
+        The same filter has to be applied everywhere the prediction graph is
+        built (model loading, bulk inference on training data), otherwise the
+        resulting predict signatures would diverge.
+        """
+        return {
+            feature_name: features
+            for feature_name, features in data.items()
+            if feature_name in PREDICTION_FEATURES
+        }
+
     @classmethod
     def _construct_model_initialization_data(
         cls, loaded_data: Dict[Text, Dict[Text, List[FeatureArray]]]
@@ -1155,13 +1207,8 @@ class TEDPolicy(Policy):
         predict_data_example = RasaModelData(
             label_key=LABEL_KEY,
             label_sub_key=LABEL_SUB_KEY,
-            data={
-                feature_name: features
-                for feature_name, features in model_data_example.items()
-                if feature_name
-                # we need to remove label features for prediction if they are present
-                in PREDICTION_FEATURES
-            },
+            # we need to remove label features for prediction if they are present
+            data=cls._filter_prediction_features(model_data_example.data),
         )
         return model_data_example, predict_data_example
 
@@ -1243,15 +1290,15 @@ class TED(TransformerRasaModel):
     # ---CREATING LAYERS HELPERS---
 
     def _prepare_layers(self) -> None:
-        for name in self.data_signature.keys():
+        for name, attribute_signature in self.data_signature.items():
             self._prepare_input_layers(
-                name, self.data_signature[name], is_label_attribute=False
+                name, attribute_signature, is_label_attribute=False
             )
             self._prepare_encoding_layers(name)
 
-        for name in self.label_signature.keys():
+        for name, attribute_signature in self.label_signature.items():
             self._prepare_input_layers(
-                name, self.label_signature[name], is_label_attribute=True
+                name, attribute_signature, is_label_attribute=True
             )
             self._prepare_encoding_layers(name)
 
@@ -1378,8 +1425,12 @@ class TED(TransformerRasaModel):
 
         x = self._collect_label_attribute_encodings(all_labels_encoded)
 
-        # additional sequence axis is artifact of our RasaModelData creation
-        # TODO check whether this should be solved in data creation
+        # the additional sequence axis is an artifact of our RasaModelData
+        # creation: every label is encoded as a single-turn dialogue, so its
+        # features carry a dialogue dimension of length 1. Dropping that axis
+        # already at data creation would require label-specific variants of the
+        # shared feature-processing layers, whereas this squeeze compiles to a
+        # free reshape in the graph.
         x = tf.squeeze(x, axis=1)
 
         all_labels_embed = self._tf_layers[f"embed.{LABEL}"](x)
@@ -1969,6 +2020,9 @@ class TED(TransformerRasaModel):
         tf_batch_data = self.batch_to_model_data_format(batch_in, self.data_signature)
         self._compute_dialogue_indices(tf_batch_data)
 
+        # label embeddings have to be recomputed every training step (and cannot
+        # be cached like in `prepare_for_predict`) so that gradients of the loss
+        # keep flowing into the layers which encode the labels
         all_label_ids, all_labels_embed = self._create_all_labels_embed()
 
         label_ids = tf_batch_data[LABEL_KEY][LABEL_SUB_KEY][0]
@@ -2020,6 +2074,11 @@ class TED(TransformerRasaModel):
     def prepare_for_predict(self) -> None:
         """Prepares the model for prediction."""
         _, self.all_labels_embed = self._create_all_labels_embed()
+        if self.config[SIMILARITY_TYPE] == COSINE:
+            # Normalize the label embeddings once here so that cosine
+            # similarity in `batch_predict` doesn't have to re-normalize them
+            # on every call.
+            self.all_labels_embed = tf.nn.l2_normalize(self.all_labels_embed, axis=-1)
 
     def batch_predict(
         self, batch_in: Union[Tuple[tf.Tensor, ...], Tuple[np.ndarray, ...]]
@@ -2054,12 +2113,16 @@ class TED(TransformerRasaModel):
         ) = self._embed_dialogue(dialogue_in, tf_batch_data)
         dialogue_mask = tf.squeeze(dialogue_mask, axis=-1)
 
+        # contract the feature dimension directly instead of broadcasting
+        # the embeddings into a `(batch_size, seq_len, num_labels, units)`
+        # intermediate tensor
         sim_all, scores = self._tf_layers[
             f"loss.{LABEL}"
-        ].get_similarities_and_confidences_from_embeddings(
-            dialogue_embed[:, :, tf.newaxis, :],
-            self.all_labels_embed[tf.newaxis, tf.newaxis, :, :],
+        ].get_similarities_and_confidences_for_all_labels(
+            dialogue_embed,
+            self.all_labels_embed,
             dialogue_mask,
+            labels_prenormalized=True,
         )
 
         predictions = {
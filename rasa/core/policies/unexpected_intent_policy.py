@@ -46,7 +46,6 @@ from rasa.core.policies.ted_policy import (
     TED,
     SEQUENCE_LENGTH,
     SEQUENCE,
-    PREDICTION_FEATURES,
 )
 from rasa.utils import train_utils
 from rasa.utils.tensorflow.models import RasaModel
@@ -392,12 +391,9 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         Returns:
             Transformed data usable for making predictions.
         """
-        filtered_data: Dict[Text, Dict[Text, Any]] = {
-            key: features
-            for key, features in model_data.data.items()
-            if key in PREDICTION_FEATURES
-        }
-        return RasaModelData(data=filtered_data)
+        return RasaModelData(
+            data=UnexpecTEDIntentPolicy._filter_prediction_features(model_data.data)
+        )
 
     def compute_label_quantiles_post_training(
         self, model_data: RasaModelData, label_ids: np.ndarray
@@ -778,22 +774,20 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         if LABEL_PAD_ID in unique_label_ids:
             unique_label_ids.remove(LABEL_PAD_ID)
 
-        label_id_scores: Dict[int, Dict[Text, List[float]]] = {
-            label_id: {POSITIVE_SCORES_KEY: [], NEGATIVE_SCORES_KEY: []}
-            for label_id in unique_label_ids
-        }
+        # similarities of the first dialogue turn for all labels
+        all_similarities = output_scores["similarities"][:, 0, :]
+
+        label_id_scores: Dict[int, Dict[Text, List[float]]] = {}
 
-        for index, all_pos_labels in enumerate(label_ids):
-
-            for candidate_label_id in unique_label_ids:
-                if candidate_label_id in all_pos_labels:
-                    label_id_scores[candidate_label_id][POSITIVE_SCORES_KEY].append(
-                        output_scores["similarities"][index, 0, candidate_label_id]
-                    )
-                else:
-                    label_id_scores[candidate_label_id][NEGATIVE_SCORES_KEY].append(
-                        output_scores["similarities"][index, 0, candidate_label_id]
-                    )
+        # one vectorized pass per label id instead of a Python loop
+        # over every (tracker, label id) pair
+        for candidate_label_id in unique_label_ids:
+            is_positive = np.any(label_ids == candidate_label_id, axis=-1)
+            scores_for_label = all_similarities[:, candidate_label_id]
+            label_id_scores[candidate_label_id] = {
+                POSITIVE_SCORES_KEY: scores_for_label[is_positive].tolist(),
+                NEGATIVE_SCORES_KEY: scores_for_label[~is_positive].tolist(),
+            }
 
         return label_id_scores
 
@@ -1842,9 +1842,8 @@ class DIET(TransformerRasaModel):
 
         _, scores = self._tf_layers[
             f"loss.{LABEL}"
-        ].get_similarities_and_confidences_from_embeddings(
-            sentence_vector_embed[:, tf.newaxis, :],
-            self.all_labels_embed[tf.newaxis, :, :],
+        ].get_similarities_and_confidences_for_all_labels(
+            sentence_vector_embed, self.all_labels_embed
         )
 
         return {"i_scores": scores}
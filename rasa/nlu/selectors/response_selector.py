@@ -981,9 +981,8 @@ class DIET2DIET(DIET):
 
         _, scores = self._tf_layers[
             f"loss.{LABEL}"
-        ].get_similarities_and_confidences_from_embeddings(
-            sentence_vector_embed[:, tf.newaxis, :],
-            self.all_labels_embed[tf.newaxis, :, :],
+        ].get_similarities_and_confidences_for_all_labels(
+            sentence_vector_embed, self.all_labels_embed
         )
         predictions["i_scores"] = scores
 
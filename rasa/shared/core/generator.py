@@ -531,12 +531,9 @@ class TrainingDataGenerator:
         logger.debug("Found {} training trackers.".format(len(finished_trackers)))
 
         if self.config.augmentation_factor > 0:
-            augmented_trackers, original_trackers = [], []
-            for t in finished_trackers:
-                if t.is_augmented:
-                    augmented_trackers.append(t)
-                else:
-                    original_trackers.append(t)
+            augmented_trackers, original_trackers = self._separate_augmented_trackers(
+                finished_trackers
+            )
             augmented_trackers = self._subsample_trackers(
                 augmented_trackers, self.config.max_number_of_augmented_trackers
             )
@@ -551,6 +548,31 @@ class TrainingDataGenerator:
 
         return finished_trackers
 
+    @staticmethod
+    def _separate_augmented_trackers(
+        trackers: List[TrackerWithCachedStates],
+    ) -> TrackersTuple:
+        """Separates augmented trackers from the original ones in a single pass.
+
+        Args:
+            trackers: All finished trackers.
+
+        Returns:
+            The augmented trackers and the original trackers.
+        """
+        augmented_trackers: List[TrackerWithCachedStates] = []
+        original_trackers: List[TrackerWithCachedStates] = []
+        # bind the append methods locally to avoid repeated attribute
+        # lookups for potentially very large tracker lists
+        append_augmented = augmented_trackers.append
+        append_original = original_trackers.append
+        for tracker in trackers:
+            if tracker.is_augmented:
+                append_augmented(tracker)
+            else:
+                append_original(tracker)
+        return augmented_trackers, original_trackers
+
     @staticmethod
     def _count_trackers(active_trackers: TrackerLookupDict) -> int:
         """Count the number of trackers in the tracker dictionary."""
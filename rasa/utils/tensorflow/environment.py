@@ -8,6 +8,7 @@ from rasa.constants import (
     ENV_GPU_CONFIG,
     ENV_CPU_INTER_OP_CONFIG,
     ENV_CPU_INTRA_OP_CONFIG,
+    ENV_MIXED_PRECISION_POLICY,
 )
 from rasa.utils.tensorflow.constants import TF_DETERMINISTIC_OPS
 from rasa.shared.utils import io as shared_io_utils
@@ -144,10 +145,42 @@ def _setup_cpu_environment() -> None:
         )
 
 
+VALID_MIXED_PRECISION_POLICIES = ["mixed_float16", "mixed_bfloat16"]
+
+
+def _setup_mixed_precision_environment() -> None:
+    """Sets the Keras mixed precision policy based on environment variable.
+
+    Mixed precision keeps model weights in `float32` but runs most layer
+    computations in a 16-bit floating point type, which reduces memory
+    bandwidth usage and can speed up training and inference on hardware
+    with native 16-bit support (e.g. GPUs with tensor cores for
+    `mixed_float16`, recent CPUs / TPUs for `mixed_bfloat16`).
+    """
+    mixed_precision_policy = os.getenv(ENV_MIXED_PRECISION_POLICY)
+
+    if not mixed_precision_policy:
+        return
+
+    if mixed_precision_policy not in VALID_MIXED_PRECISION_POLICIES:
+        raise ValueError(
+            f"Error parsing the environment variable "
+            f"'{ENV_MIXED_PRECISION_POLICY}'. The value should be one of "
+            f"{VALID_MIXED_PRECISION_POLICIES} but found "
+            f"'{mixed_precision_policy}'."
+        )
+
+    from tensorflow.keras import mixed_precision
+
+    mixed_precision.set_global_policy(mixed_precision_policy)
+    logger.debug(f"Set the Keras mixed precision policy to '{mixed_precision_policy}'.")
+
+
 def setup_tf_environment() -> None:
     """Setup CPU and GPU related environment settings for TensorFlow."""
     _setup_cpu_environment()
     _setup_gpu_environment()
+    _setup_mixed_precision_environment()
 
 
 def check_deterministic_ops() -> None:
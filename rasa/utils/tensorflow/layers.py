@@ -797,6 +797,54 @@ class DotProductLoss(tf.keras.layers.Layer):
             confidences = tf.nn.softmax(similarities)
         return similarities, confidences
 
+    def get_similarities_and_confidences_for_all_labels(
+        self,
+        input_embeddings: tf.Tensor,
+        all_labels_embed: tf.Tensor,
+        mask: Optional[tf.Tensor] = None,
+        labels_prenormalized: bool = False,
+    ) -> Tuple[tf.Tensor, tf.Tensor]:
+        """Computes similarities of the inputs to every label as a single matmul.
+
+        Semantically equivalent to broadcasting `input_embeddings` and
+        `all_labels_embed` against each other and calling
+        `get_similarities_and_confidences_from_embeddings`, but contracts the
+        feature dimension directly instead of materializing the intermediate
+        `(batch_size, seq_len, num_labels, units)` tensor.
+
+        Args:
+            input_embeddings: Embeddings of input;
+                shape `(batch_size, seq_len, units)` or `(batch_size, units)`.
+            all_labels_embed: Embeddings of all labels;
+                shape `(num_labels, units)`.
+            mask: Mask (should contain 1s for inputs and 0s for padding);
+                shape `(batch_size, seq_len)`. Only supported for
+                sequence-level (3-D) input embeddings.
+            labels_prenormalized: If `True`, `all_labels_embed` is assumed to
+                already be l2-normalized and is not normalized again for
+                cosine similarity.
+
+        Returns:
+            Similarity between the inputs and each label and model's prediction
+            confidence for each label;
+            both of shape `(batch_size, seq_len, num_labels)` or
+            `(batch_size, num_labels)`, depending on the input shape.
+        """
+        if self.similarity_type == COSINE:
+            input_embeddings = tf.nn.l2_normalize(input_embeddings, axis=-1)
+            if not labels_prenormalized:
+                all_labels_embed = tf.nn.l2_normalize(all_labels_embed, axis=-1)
+        if len(input_embeddings.shape) == 2:
+            similarities = tf.einsum("bd,nd->bn", input_embeddings, all_labels_embed)
+        else:
+            similarities = tf.einsum("btd,nd->btn", input_embeddings, all_labels_embed)
+        if mask is not None:
+            similarities *= tf.expand_dims(mask, 2)
+        confidences = similarities
+        if self.model_confidence == SOFTMAX:
+            confidences = tf.nn.softmax(similarities)
+        return similarities, confidences
+
     def call(self, *args: Any, **kwargs: Any) -> Tuple[tf.Tensor, tf.Tensor]:
         """Layer's logic - to be implemented in child class."""
         raise NotImplementedError
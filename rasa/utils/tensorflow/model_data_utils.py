@@ -211,12 +211,21 @@ def _filter_features(
 
     # it might be that the list of features also contains some tag_ids
     # the origin of the tag_ids is set to TAG_ID_ORIGIN
-    # add TAG_ID_ORIGIN to the list of featurizers to make sure that we keep the
-    # tag_ids
-    featurizers.append(TAG_ID_ORIGIN)
+    # add TAG_ID_ORIGIN to the featurizers to make sure that we keep the
+    # tag_ids; use a local set so that the caller's list is not mutated and
+    # the membership checks below are constant time
+    featurizers_to_consider = set(featurizers)
+    featurizers_to_consider.add(TAG_ID_ORIGIN)
+
+    def comes_from_featurizers(origin: Union[Text, List[Text]]) -> bool:
+        # combined features carry the origins of all features they were
+        # built from; keep them only if every origin is to be considered
+        if isinstance(origin, str):
+            return origin in featurizers_to_consider
+        return all(o in featurizers_to_consider for o in origin)
 
     # filter the features
-    return [f for f in features if f.origin in featurizers]
+    return [f for f in features if comes_from_featurizers(f.origin)]
 
 
 def _create_fake_features(
@@ -3,6 +3,7 @@ import numpy as np
 import logging
 import random
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Text, Dict, Tuple, Union, Optional, Any, TYPE_CHECKING
 
 from keras.utils import tf_utils
@@ -48,6 +49,7 @@ from rasa.shared.exceptions import RasaException
 
 
 if TYPE_CHECKING:
+    from keras.callbacks import History
     from tensorflow.python.types.core import GenericFunction
 
 
@@ -133,6 +135,20 @@ class RasaModel(TmpKerasModel):
         """
         raise NotImplementedError
 
+    def fit(self, *args: Any, **kwargs: Any) -> "History":
+        """Trains the model (see `TmpKerasModel.fit` for the full docstring).
+
+        Invalidates any state that was prepared for prediction before training
+        starts. Values computed by `prepare_for_predict` (e.g.
+        `self.all_labels_embed`) are captured as constants inside the traced
+        prediction function, so predictions made after (re-)training have to
+        re-prepare and re-trace with the new weights instead of reusing
+        stale cached values.
+        """
+        self.prepared_for_prediction = False
+        self._tf_predict_step = None
+        return super().fit(*args, **kwargs)
+
     def train_step(
         self, batch_in: Union[Tuple[tf.Tensor, ...], Tuple[np.ndarray, ...]]
     ) -> Dict[Text, float]:
@@ -231,6 +247,11 @@ class RasaModel(TmpKerasModel):
     def _dynamic_signature(
         batch_in: Union[Tuple[tf.Tensor, ...], Tuple[np.ndarray, ...]]
     ) -> List[List[tf.TensorSpec]]:
+        # relax all dimensions except the feature dimension, so that a single
+        # concrete function serves every batch size and sequence length; model
+        # hyperparameters (transformer size, number of heads, etc.) are Python
+        # constants at trace time and therefore already baked into that one
+        # specialized graph
         element_spec = []
         for tensor in batch_in:
             if len(tensor.shape) > 1:
@@ -271,6 +292,12 @@ class RasaModel(TmpKerasModel):
             return outputs
 
         if self._tf_predict_step is None:
+            # the whole predict step (encoding, dialogue embedding, similarity
+            # to all labels and the softmax over those similarities) is traced
+            # into one graph here, so the TF grappler can fuse and optimize it
+            # as a unit. XLA (`jit_compile=True`) cannot be used on top of it:
+            # the batch contains `tf.SparseTensor`s and the models use ragged
+            # `tf.map_fn` ops, neither of which is XLA-compilable.
             self._tf_predict_step = tf.function(
                 self.predict_step, input_signature=self._dynamic_signature(batch_in)
             )
@@ -306,13 +333,21 @@ class RasaModel(TmpKerasModel):
         (data_generator, _) = rasa.utils.train_utils.create_data_generators(
             model_data=model_data, batch_sizes=batch_size, epochs=1, shuffle=False
         )
-        data_iterator = iter(data_generator)
-        while True:
-            try:
-                # data_generator is a tuple of 2 elements - input and output.
-                # We only need input, since output is always None and not
-                # consumed by our TF graphs.
-                batch_in = next(data_iterator)[0]
+        number_of_batches = len(data_generator)
+        if number_of_batches == 0:
+            return outputs
+        # batch preparation (padding and sparse matrix conversion) runs in
+        # numpy on the Python side, so prepare the next batch on a background
+        # thread while the model is busy with the current one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_batch = executor.submit(data_generator.__getitem__, 0)
+            for index in range(number_of_batches):
+                # each item of data_generator is a tuple of 2 elements - input
+                # and output. We only need input, since output is always None
+                # and not consumed by our TF graphs.
+                batch_in = next_batch.result()[0]
+                if index + 1 < number_of_batches:
+                    next_batch = executor.submit(data_generator.__getitem__, index + 1)
                 batch_out: Dict[
                     Text, Union[np.ndarray, Dict[Text, Any]]
                 ] = self._rasa_predict(batch_in)
@@ -323,9 +358,6 @@ class RasaModel(TmpKerasModel):
                         if key in output_keys_expected
                     }
                 outputs = self._merge_batch_outputs(outputs, batch_out)
-            except StopIteration:
-                # Generator ran out of batches, time to finish inferencing
-                break
         return outputs
 
     @staticmethod
@@ -10,7 +10,7 @@ from rasa.utils.tensorflow.layers import (
     RandomlyConnectedDense,
     DenseForSparse,
 )
-from rasa.utils.tensorflow.constants import INNER, SOFTMAX, LABEL, LABEL_PAD_ID
+from rasa.utils.tensorflow.constants import COSINE, INNER, SOFTMAX, LABEL, LABEL_PAD_ID
 import rasa.utils.tensorflow.layers_utils as layers_utils
 from rasa.shared.nlu.constants import (
     TEXT,
@@ -384,6 +384,85 @@ def test_dot_product_loss_get_similarities_and_confidences_from_embeddings(
     assert np.all(confidences == expected_confidences)
 
 
+@pytest.mark.parametrize("similarity_type", [INNER, COSINE])
+def test_dot_product_loss_get_similarities_and_confidences_for_all_labels(
+    similarity_type: Text,
+):
+    batch_size, seq_len, num_labels, units = 3, 2, 5, 4
+    input_embeddings = tf.random.uniform([batch_size, seq_len, units])
+    all_labels_embed = tf.random.uniform([num_labels, units])
+    mask = tf.constant([[1.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
+
+    layer = DotProductLoss(1, similarity_type=similarity_type)
+
+    similarities, confidences = layer.get_similarities_and_confidences_for_all_labels(
+        input_embeddings, all_labels_embed, mask
+    )
+
+    # The fused computation must match the broadcast-based one
+    (
+        expected_similarities,
+        expected_confidences,
+    ) = layer.get_similarities_and_confidences_from_embeddings(
+        input_embeddings[:, :, tf.newaxis, :],
+        all_labels_embed[tf.newaxis, tf.newaxis, :, :],
+        mask,
+    )
+    assert np.allclose(similarities.numpy(), expected_similarities.numpy(), atol=1e-6)
+    assert np.allclose(confidences.numpy(), expected_confidences.numpy(), atol=1e-6)
+
+
+def test_dot_product_loss_similarities_for_all_labels_with_prenormalized_labels():
+    batch_size, seq_len, num_labels, units = 3, 2, 5, 4
+    input_embeddings = tf.random.uniform([batch_size, seq_len, units])
+    all_labels_embed = tf.random.uniform([num_labels, units])
+
+    layer = DotProductLoss(1, similarity_type=COSINE)
+
+    similarities, confidences = layer.get_similarities_and_confidences_for_all_labels(
+        input_embeddings, all_labels_embed
+    )
+
+    # Normalizing the label embeddings up front and skipping the per-call
+    # normalization must not change the result
+    (
+        prenormalized_similarities,
+        prenormalized_confidences,
+    ) = layer.get_similarities_and_confidences_for_all_labels(
+        input_embeddings,
+        tf.nn.l2_normalize(all_labels_embed, axis=-1),
+        labels_prenormalized=True,
+    )
+    assert np.allclose(
+        similarities.numpy(), prenormalized_similarities.numpy(), atol=1e-6
+    )
+    assert np.allclose(
+        confidences.numpy(), prenormalized_confidences.numpy(), atol=1e-6
+    )
+
+
+def test_dot_product_loss_similarities_for_all_labels_without_sequence_dimension():
+    batch_size, num_labels, units = 3, 5, 4
+    input_embeddings = tf.random.uniform([batch_size, units])
+    all_labels_embed = tf.random.uniform([num_labels, units])
+
+    layer = DotProductLoss(1, similarity_type=INNER)
+
+    similarities, confidences = layer.get_similarities_and_confidences_for_all_labels(
+        input_embeddings, all_labels_embed
+    )
+
+    (
+        expected_similarities,
+        expected_confidences,
+    ) = layer.get_similarities_and_confidences_from_embeddings(
+        input_embeddings[:, tf.newaxis, :], all_labels_embed[tf.newaxis, :, :]
+    )
+    assert similarities.shape == (batch_size, num_labels)
+    assert np.allclose(similarities.numpy(), expected_similarities.numpy(), atol=1e-6)
+    assert np.allclose(confidences.numpy(), expected_confidences.numpy(), atol=1e-6)
+
+
 @pytest.mark.parametrize(
     "inputs, units, expected_output_shape",
     [
@@ -347,6 +347,33 @@ def test_convert_training_examples(
                 ),
             ],
         ),
+        # combined features have a list of origins and are kept only if all
+        # their origins are considered
+        (
+            [
+                Features(
+                    np.random.rand(5, 14),
+                    FEATURE_TYPE_SENTENCE,
+                    TEXT,
+                    ["featurizer-a", "featurizer-b"],
+                ),
+                Features(
+                    np.random.rand(5, 14),
+                    FEATURE_TYPE_SENTENCE,
+                    TEXT,
+                    ["featurizer-b", "featurizer-c"],
+                ),
+            ],
+            ["featurizer-a", "featurizer-b"],
+            [
+                Features(
+                    np.random.rand(5, 14),
+                    FEATURE_TYPE_SENTENCE,
+                    TEXT,
+                    ["featurizer-a", "featurizer-b"],
+                )
+            ],
+        ),
     ],
 )
 def test_filter_features(
@@ -1,6 +1,9 @@
 import pytest
 from typing import Text, Dict
-from rasa.utils.tensorflow.environment import _parse_gpu_config
+from rasa.utils.tensorflow.environment import (
+    _parse_gpu_config,
+    _setup_mixed_precision_environment,
+)
 
 
 @pytest.mark.parametrize(
@@ -9,3 +12,19 @@ from rasa.utils.tensorflow.environment import _parse_gpu_config
 )
 def test_gpu_config_parser(gpu_config_string: Text, parsed_gpu_config: Dict[int, int]):
     assert _parse_gpu_config(gpu_config_string) == parsed_gpu_config
+
+
+def test_mixed_precision_setup_is_noop_without_env_variable(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delenv("TF_MIXED_PRECISION_POLICY", raising=False)
+    # should not raise nor import tensorflow
+    _setup_mixed_precision_environment()
+
+
+def test_mixed_precision_setup_rejects_invalid_policy(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("TF_MIXED_PRECISION_POLICY", "float8")
+    with pytest.raises(ValueError):
+        _setup_mixed_precision_environment()